@@ -1,17 +1,30 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, stream_with_context
 from flask_pymongo import PyMongo
 from flask_marshmallow import Marshmallow
+from flask_caching import Cache
 from flask_swagger_ui import get_swaggerui_blueprint
 from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.exceptions import BadRequest
 from bson.objectid import ObjectId
+from pymongo.errors import DuplicateKeyError, OperationFailure
 import os
+import hashlib
+import orjson
 import secrets
+import threading
+import time
 from dotenv import load_dotenv
 import jwt
+from cachetools import TTLCache
 import datetime
 from functools import wraps
-from dateutil import parser
-from dateutil.relativedelta import relativedelta
+from operator import itemgetter
+
+try:
+    from gevent import get_hub
+    from gevent.monkey import is_module_patched
+except ImportError:  # gevent is only needed under gevent workers
+    get_hub = None
 
 # Load environment variables from .env file
 load_dotenv()
@@ -21,9 +34,119 @@ app = Flask(__name__)
 app.config["MONGO_URI"] = os.getenv('MONGO_URI')
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', secrets.token_hex(32))
 
+# JWT signing key encoded once instead of on every encode/decode
+JWT_ALGORITHM = 'HS256'
+JWT_SECRET = app.config['SECRET_KEY'].encode('utf-8')
+
+# Password hashing: scrypt runs in hashlib's C implementation; override with
+# e.g. 'pbkdf2:sha256:50000' to trade hashing cost against login latency
+PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'scrypt')
+
 # Initialize extensions
-mongo = PyMongo(app)
+# Pool options keep warm connections per worker and allow parallel refills under load
+mongo = PyMongo(
+    app,
+    maxPoolSize=int(os.getenv('MONGO_MAX_POOL_SIZE', 50)),
+    minPoolSize=int(os.getenv('MONGO_MIN_POOL_SIZE', 5)),
+    maxConnecting=int(os.getenv('MONGO_MAX_CONNECTING', 10)),
+    socketTimeoutMS=int(os.getenv('MONGO_SOCKET_TIMEOUT_MS', 5000)),
+    connectTimeoutMS=int(os.getenv('MONGO_CONNECT_TIMEOUT_MS', 3000)),
+    maxIdleTimeMS=int(os.getenv('MONGO_MAX_IDLE_TIME_MS', 60000)),
+    # Wire compression shrinks the list-heavy responses; zlib is the fallback if zstd is unsupported
+    compressors=os.getenv('MONGO_COMPRESSORS', 'zstd,zlib'),
+    zlibCompressionLevel=int(os.getenv('MONGO_ZLIB_COMPRESSION_LEVEL', 3))
+)
 ma = Marshmallow(app)
+# Shared Redis cache; without REDIS_URL caching is disabled, since a per-process
+# cache could not be invalidated across gunicorn workers
+cache = Cache(app, config={
+    'CACHE_TYPE': 'RedisCache' if os.getenv('REDIS_URL') else 'NullCache',
+    'CACHE_REDIS_URL': os.getenv('REDIS_URL')
+})
+
+# Available-turf listing cache. Pages are keyed under a version number that
+# every turf mutation bumps, so all cached pages go stale at once.
+TURFS_CACHE_TIMEOUT = 60
+TURFS_CACHE_VERSION_KEY = 'turfs_available:version'
+
+# Cache backend errors (e.g. Redis down) are logged and treated as misses, like
+# Flask-Caching's own decorators do, so they never fail a request or turn an
+# already-committed MongoDB write into a 5xx.
+def turfs_cache_version():
+    # None when the version cannot be read, meaning: bypass the cache
+    try:
+        return cache.get(TURFS_CACHE_VERSION_KEY) or 0
+    except Exception:
+        app.logger.exception('Turf cache unavailable, reading version failed')
+        return None
+
+def get_cached_turfs(cache_key):
+    try:
+        return cache.get(cache_key)
+    except Exception:
+        app.logger.exception('Turf cache unavailable, reading %s failed', cache_key)
+        return None
+
+def set_cached_turfs(cache_key, turfs_list):
+    try:
+        if cache_key:
+            set_cached_turfs(cache_key, turfs_list)
+    except Exception:
+        app.logger.exception('Turf cache unavailable, writing %s failed', cache_key)
+
+def invalidate_turfs_cache():
+    # Atomic INCR in Redis, so concurrent writers never lose a bump
+    try:
+        cache.inc(TURFS_CACHE_VERSION_KEY)
+    except Exception:
+        app.logger.exception('Turf cache unavailable, invalidation skipped')
+
+def duplicate_key_response(error):
+    details = error.details or {}
+    # keyValue is the fallback when the server omits keyPattern
+    if 'email' in (details.get('keyPattern') or details.get('keyValue') or {}):
+        return json_response({'message': 'Email already registered'}), 400
+    return json_response({'message': 'Username already taken'}), 400
+
+# JSON responses encoded with orjson, which emits bytes directly
+def encode_json(data):
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+def json_response(data, status=200):
+    return Response(encode_json(data), status=status, mimetype='application/json')
+
+# Streams a cursor as a JSON array one document at a time instead of building the whole body
+def stream_json_list(first, cursor, dump):
+    def generate():
+        yield b'[' + encode_json(dump(first))
+        for doc in cursor:
+            yield b',' + encode_json(dump(doc))
+        yield b']'
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+# Parses a 24-hex id once per request; None when malformed so routes can answer 400
+def parse_object_id(value):
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    return None
+
+# Password hashing is a multi-ms CPU burst; under gevent workers it runs on a native
+# thread (hashlib releases the GIL) so the hub keeps serving other greenlets
+def run_blocking(func, *args):
+    if get_hub is not None and is_module_patched('threading'):
+        return get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+# Request bodies parsed with orjson straight from the raw payload
+def get_json_body():
+    try:
+        return orjson.loads(request.get_data(cache=False) or b'{}')
+    except orjson.JSONDecodeError:
+        raise BadRequest('Failed to decode JSON object')
+
+# Verified tokens, so repeat requests skip the HS256 signature check
+_jwt_cache = TTLCache(maxsize=10_000, ttl=300)
+_jwt_cache_lock = threading.Lock()
 
 # JWT Token Required Decorator
 def token_required(f):
@@ -31,13 +154,21 @@ def token_required(f):
     def decorated(*args, **kwargs):
         token = request.headers.get('Authorization')
         if not token:
-            return jsonify({'message': 'Token is missing'}), 401
+            return json_response({'message': 'Token is missing'}), 401
         try:
             token = token.split(" ")[1]  # Remove 'Bearer' prefix
-            data = jwt.decode(token, app.config['SECRET_KEY'], algorithms=["HS256"])
-            current_user = data['user_type'], data['user_id']
+            with _jwt_cache_lock:
+                cached = _jwt_cache.get(token)
+            # Cached entries are only trusted until the token's own expiry
+            if cached and cached[2] > time.time():
+                current_user = cached[0], cached[1]
+            else:
+                data = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+                current_user = data['user_type'], data['user_id']
+                with _jwt_cache_lock:
+                    _jwt_cache[token] = (data['user_type'], data['user_id'], data['exp'])
         except:
-            return jsonify({'message': 'Token is invalid'}), 401
+            return json_response({'message': 'Token is invalid'}), 401
         return f(current_user, *args, **kwargs)
     return decorated
 
@@ -50,22 +181,95 @@ class TurfOwnerSchema(ma.Schema):
     class Meta:
         fields = ("id", "username", "email", "name", "phone", "business_name", "address", "created_at")
 
-class TurfSchema(ma.Schema):
-    class Meta:
-        fields = ("id", "name", "location", "size", "amenities", "price_per_hour", "owner_id", "availability", "surface_type", "capacity", "description")
-
-class BookingSchema(ma.Schema):
-    class Meta:
-        fields = ("id", "user_id", "turf_id", "start_time", "end_time", "status", "total_cost", "created_at", "notes")
-
 user_schema = UserSchema()
 users_schema = UserSchema(many=True)
 turf_owner_schema = TurfOwnerSchema()
 turf_owners_schema = TurfOwnerSchema(many=True)
-turf_schema = TurfSchema()
-turfs_schema = TurfSchema(many=True)
-booking_schema = BookingSchema()
-bookings_schema = BookingSchema(many=True)
+
+# Pagination defaults for listing endpoints
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 500
+
+# Largest batch accepted by the bulk turf endpoint
+MAX_BULK_TURFS = 500
+
+# Profile fields stored alongside username/email/password for each account type
+USER_PROFILE_FIELDS = ('full_name', 'phone')
+OWNER_PROFILE_FIELDS = ('name', 'phone', 'business_name', 'address')
+
+# Turf fields an owner may change through update_turf
+TURF_UPDATE_FIELDS = ('name', 'location', 'size', 'amenities', 'price_per_hour', 'availability', 'surface_type', 'capacity', 'description')
+
+# Projections limiting fetched fields to what the serializers use
+TURF_FIELDS = ("name", "location", "size", "amenities", "price_per_hour", "owner_id", "availability", "surface_type", "capacity", "description")
+TURF_PROJECTION = {field: 1 for field in TURF_FIELDS}
+BOOKING_FIELDS = ("user_id", "turf_id", "start_time", "end_time", "status", "total_cost", "created_at", "notes")
+BOOKING_PROJECTION = {field: 1 for field in BOOKING_FIELDS}
+
+# Cursor batch size for streamed listings, well above the driver's default first batch of 101
+LISTING_BATCH_SIZE = 500
+
+# Plain dict serializers for hot listing endpoints, bypassing Marshmallow's per-field dump
+def dump_turf(turf):
+    return {
+        'id': str(turf['_id']),
+        'name': turf.get('name'),
+        'location': turf.get('location'),
+        'size': turf.get('size'),
+        'amenities': turf.get('amenities', []),
+        'price_per_hour': turf.get('price_per_hour'),
+        'owner_id': str(turf.get('owner_id')),
+        'availability': turf.get('availability'),
+        'surface_type': turf.get('surface_type'),
+        'capacity': turf.get('capacity'),
+        'description': turf.get('description', '')
+    }
+
+# Datetimes are passed through; orjson renders them as ISO 8601 strings
+def dump_booking(booking):
+    return {
+        'id': str(booking['_id']),
+        'user_id': booking.get('user_id'),
+        'turf_id': booking.get('turf_id'),
+        'start_time': booking.get('start_time'),
+        'end_time': booking.get('end_time'),
+        'status': booking.get('status'),
+        'total_cost': booking.get('total_cost'),
+        'created_at': booking.get('created_at'),
+        'notes': booking.get('notes', '')
+    }
+
+# Required request fields pulled out in a single C-level call
+_turf_required_keys = itemgetter('name', 'location', 'size', 'price_per_hour', 'surface_type', 'capacity')
+_booking_required_keys = itemgetter('turf_id', 'start_time', 'end_time')
+_login_keys = itemgetter('email', 'password')
+
+# Builds a turf document from request data, or returns None when required fields are missing
+def build_turf(data, owner_id):
+    try:
+        name, location, size, price_per_hour, surface_type, capacity = _turf_required_keys(data)
+    except (KeyError, TypeError):
+        return None
+    amenities = data.get('amenities', [])
+    availability = data.get('availability', True)
+    description = data.get('description', '')
+
+    # Numeric fields are checked against None so that 0 is not treated as missing
+    if not (name and location and size and surface_type) or price_per_hour is None or capacity is None:
+        return None
+
+    return {
+        'owner_id': owner_id,
+        'name': name,
+        'location': location,
+        'size': size,
+        'amenities': amenities,
+        'price_per_hour': price_per_hour,
+        'availability': availability,
+        'surface_type': surface_type,
+        'capacity': capacity,
+        'description': description
+    }
 
 # Swagger configuration
 SWAGGER_URL = '/api/docs'
@@ -81,252 +285,329 @@ swaggerui_blueprint = get_swaggerui_blueprint(
 
 app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
 
-# Create Swagger JSON
-@app.route('/static/swagger.json')
-def swagger_json():
-    swagger = {
-        "swagger": "2.0",
-        "info": {
-            "title": "Turf Booking API",
-            "description": "API for user and turf owner management, turf booking system",
-            "version": "3.0.0"
-        },
-        "basePath": "/",
-        "schemes": ["http"],
-        "securityDefinitions": {
-            "Bearer": {
-                "type": "apiKey",
-                "name": "Authorization",
-                "in": "header"
-            }
-        },
-        "tags": [
-            {"name": "User", "description": "Operations for users"},
-            {"name": "Turf Owner", "description": "Operations for turf owners"}
-        ],
-        "paths": {
-            "/user/register": {
-                "post": {
-                    "tags": ["User"],
-                    "summary": "Register a new user",
-                    "parameters": [
-                        {
-                            "name": "body",
-                            "in": "body",
-                            "required": True,
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "username": {"type": "string"},
-                                    "email": {"type": "string"},
-                                    "password": {"type": "string"},
-                                    "full_name": {"type": "string"},
-                                    "phone": {"type": "string"}
-                                }
+# Swagger JSON document, serialized once at import since it never changes
+SWAGGER_DOC = {
+    "swagger": "2.0",
+    "info": {
+        "title": "Turf Booking API",
+        "description": "API for user and turf owner management, turf booking system",
+        "version": "3.0.0"
+    },
+    "basePath": "/",
+    "schemes": ["http"],
+    "securityDefinitions": {
+        "Bearer": {
+            "type": "apiKey",
+            "name": "Authorization",
+            "in": "header"
+        }
+    },
+    "tags": [
+        {"name": "User", "description": "Operations for users"},
+        {"name": "Turf Owner", "description": "Operations for turf owners"}
+    ],
+    "paths": {
+        "/user/register": {
+            "post": {
+                "tags": ["User"],
+                "summary": "Register a new user",
+                "parameters": [
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "username": {"type": "string"},
+                                "email": {"type": "string"},
+                                "password": {"type": "string"},
+                                "full_name": {"type": "string"},
+                                "phone": {"type": "string"}
                             }
                         }
-                    ],
-                    "responses": {
-                        "201": {"description": "User created successfully"},
-                        "400": {"description": "Invalid input"}
                     }
+                ],
+                "responses": {
+                    "201": {"description": "User created successfully"},
+                    "400": {"description": "Invalid input"}
                 }
-            },
-            "/user/login": {
-                "post": {
-                    "tags": ["User"],
-                    "summary": "Login user",
-                    "parameters": [
-                        {
-                            "name": "body",
-                            "in": "body",
-                            "required": True,
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "email": {"type": "string"},
-                                    "password": {"type": "string"}
-                                }
+            }
+        },
+        "/user/login": {
+            "post": {
+                "tags": ["User"],
+                "summary": "Login user",
+                "parameters": [
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "email": {"type": "string"},
+                                "password": {"type": "string"}
                             }
                         }
-                    ],
-                    "responses": {
-                        "200": {"description": "Login successful"},
-                        "401": {"description": "Invalid credentials"}
                     }
+                ],
+                "responses": {
+                    "200": {"description": "Login successful"},
+                    "401": {"description": "Invalid credentials"}
                 }
-            },
-            "/user/turfs": {
-                "get": {
-                    "tags": ["User"],
-                    "summary": "Get all available turfs",
-                    "responses": {
-                        "200": {"description": "List of turfs"},
-                        "404": {"description": "No turfs found"}
+            }
+        },
+        "/user/turfs": {
+            "get": {
+                "tags": ["User"],
+                "summary": "Get all available turfs",
+                "parameters": [
+                    {
+                        "name": "page",
+                        "in": "query",
+                        "required": False,
+                        "type": "integer",
+                        "default": 1
+                    },
+                    {
+                        "name": "per_page",
+                        "in": "query",
+                        "required": False,
+                        "type": "integer",
+                        "default": DEFAULT_PER_PAGE
                     }
+                ],
+                "responses": {
+                    "200": {"description": "List of turfs"},
+                    "404": {"description": "No turfs found"}
                 }
-            },
-            "/user/book": {
-                "post": {
-                    "tags": ["User"],
-                    "summary": "Book a turf",
-                    "security": [{"Bearer": []}],
-                    "parameters": [
-                        {
-                            "name": "body",
-                            "in": "body",
-                            "required": True,
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "turf_id": {"type": "string"},
-                                    "start_time": {"type": "string", "format": "date-time"},
-                                    "end_time": {"type": "string", "format": "date-time"},
-                                    "notes": {"type": "string"}
-                                }
+            }
+        },
+        "/user/book": {
+            "post": {
+                "tags": ["User"],
+                "summary": "Book a turf",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "turf_id": {"type": "string"},
+                                "start_time": {"type": "string", "format": "date-time"},
+                                "end_time": {"type": "string", "format": "date-time"},
+                                "notes": {"type": "string"}
                             }
                         }
-                    ],
-                    "responses": {
-                        "201": {"description": "Booking created successfully"},
-                        "400": {"description": "Invalid input"},
-                        "409": {"description": "Time slot unavailable"}
                     }
+                ],
+                "responses": {
+                    "201": {"description": "Booking created successfully"},
+                    "400": {"description": "Invalid input"},
+                    "409": {"description": "Time slot unavailable"}
                 }
-            },
-            "/user/bookings": {
-                "get": {
-                    "tags": ["User"],
-                    "summary": "Get user bookings",
-                    "security": [{"Bearer": []}],
-                    "responses": {
-                        "200": {"description": "List of bookings"},
-                        "404": {"description": "No bookings found"}
+            }
+        },
+        "/user/bookings": {
+            "get": {
+                "tags": ["User"],
+                "summary": "Get user bookings",
+                "security": [{"Bearer": []}],
+                "responses": {
+                    "200": {"description": "List of bookings"},
+                    "404": {"description": "No bookings found"}
+                }
+            }
+        },
+        "/user/booking/<id>": {
+            "delete": {
+                "tags": ["User"],
+                "summary": "Cancel a booking",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "type": "string"
                     }
+                ],
+                "responses": {
+                    "200": {"description": "Booking cancelled"},
+                    "403": {"description": "Unauthorized"},
+                    "404": {"description": "Booking not found"}
                 }
-            },
-            "/user/booking/<id>": {
-                "delete": {
-                    "tags": ["User"],
-                    "summary": "Cancel a booking",
-                    "security": [{"Bearer": []}],
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "type": "string"
+            }
+        },
+        "/owner/register": {
+            "post": {
+                "tags": ["Turf Owner"],
+                "summary": "Register a new turf owner",
+                "parameters": [
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "username": {"type": "string"},
+                                "email": {"type": "string"},
+                                "password": {"type": "string"},
+                                "name": {"type": "string"},
+                                "phone": {"type": "string"},
+                                "business_name": {"type": "string"},
+                                "address": {"type": "string"}
+                            }
                         }
-                    ],
-                    "responses": {
-                        "200": {"description": "Booking cancelled"},
-                        "403": {"description": "Unauthorized"},
-                        "404": {"description": "Booking not found"}
                     }
+                ],
+                "responses": {
+                    "201": {"description": "Turf owner created successfully"},
+                    "400": {"description": "Invalid input"}
                 }
-            },
-            "/owner/register": {
-                "post": {
-                    "tags": ["Turf Owner"],
-                    "summary": "Register a new turf owner",
-                    "parameters": [
-                        {
-                            "name": "body",
-                            "in": "body",
-                            "required": True,
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "username": {"type": "string"},
-                                    "email": {"type": "string"},
-                                    "password": {"type": "string"},
-                                    "name": {"type": "string"},
-                                    "phone": {"type": "string"},
-                                    "business_name": {"type": "string"},
-                                    "address": {"type": "string"}
-                                }
+            }
+        },
+        "/owner/login": {
+            "post": {
+                "tags": ["Turf Owner"],
+                "summary": "Login turf owner",
+                "parameters": [
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "email": {"type": "string"},
+                                "password": {"type": "string"}
                             }
                         }
-                    ],
-                    "responses": {
-                        "201": {"description": "Turf owner created successfully"},
-                        "400": {"description": "Invalid input"}
                     }
+                ],
+                "responses": {
+                    "200": {"description": "Login successful"},
+                    "401": {"description": "Invalid credentials"}
                 }
-            },
-            "/owner/login": {
-                "post": {
-                    "tags": ["Turf Owner"],
-                    "summary": "Login turf owner",
-                    "parameters": [
-                        {
-                            "name": "body",
-                            "in": "body",
-                            "required": True,
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "email": {"type": "string"},
-                                    "password": {"type": "string"}
-                                }
+            }
+        },
+        "/owner/turf": {
+            "post": {
+                "tags": ["Turf Owner"],
+                "summary": "Add a new turf",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "location": {"type": "string"},
+                                "size": {"type": "string"},
+                                "amenities": {"type": "array", "items": {"type": "string"}},
+                                "price_per_hour": {"type": "number"},
+                                "availability": {"type": "boolean"},
+                                "surface_type": {"type": "string"},
+                                "capacity": {"type": "integer"},
+                                "description": {"type": "string"}
                             }
                         }
-                    ],
-                    "responses": {
-                        "200": {"description": "Login successful"},
-                        "401": {"description": "Invalid credentials"}
                     }
+                ],
+                "responses": {
+                    "201": {"description": "Turf created successfully"},
+                    "400": {"description": "Invalid input"}
                 }
-            },
-            "/owner/turf": {
-                "post": {
-                    "tags": ["Turf Owner"],
-                    "summary": "Add a new turf",
-                    "security": [{"Bearer": []}],
-                    "parameters": [
-                        {
-                            "name": "body",
-                            "in": "body",
-                            "required": True,
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string"},
-                                    "location": {"type": "string"},
-                                    "size": {"type": "string"},
-                                    "amenities": {"type": "array", "items": {"type": "string"}},
-                                    "price_per_hour": {"type": "number"},
-                                    "availability": {"type": "boolean"},
-                                    "surface_type": {"type": "string"},
-                                    "capacity": {"type": "integer"},
-                                    "description": {"type": "string"}
-                                }
+            }
+        },
+        "/owner/turf/<id>": {
+            "put": {
+                "tags": ["Turf Owner"],
+                "summary": "Update turf details",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "type": "string"
+                    },
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "location": {"type": "string"},
+                                "size": {"type": "string"},
+                                "amenities": {"type": "array", "items": {"type": "string"}},
+                                "price_per_hour": {"type": "number"},
+                                "availability": {"type": "boolean"},
+                                "surface_type": {"type": "string"},
+                                "capacity": {"type": "integer"},
+                                "description": {"type": "string"}
                             }
                         }
-                    ],
-                    "responses": {
-                        "201": {"description": "Turf created successfully"},
-                        "400": {"description": "Invalid input"}
                     }
+                ],
+                "responses": {
+                    "200": {"description": "Turf updated successfully"},
+                    "400": {"description": "Invalid input"},
+                    "403": {"description": "Unauthorized"},
+                    "404": {"description": "Turf not found"}
+                }
+            },
+            "delete": {
+                "tags": ["Turf Owner"],
+                "summary": "Delete a turf",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "type": "string"
+                    }
+                ],
+                "responses": {
+                    "200": {"description": "Turf deleted successfully"},
+                    "403": {"description": "Unauthorized"},
+                    "404": {"description": "Turf not found"}
+                }
+            }
+        },
+        "/owner/turfs": {
+            "get": {
+                "tags": ["Turf Owner"],
+                "summary": "Get all turfs owned by the owner",
+                "security": [{"Bearer": []}],
+                "responses": {
+                    "200": {"description": "List of turfs"},
+                    "404": {"description": "No turfs found"}
                 }
             },
-            "/owner/turf/<id>": {
-                "put": {
-                    "tags": ["Turf Owner"],
-                    "summary": "Update turf details",
-                    "security": [{"Bearer": []}],
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "type": "string"
-                        },
-                        {
-                            "name": "body",
-                            "in": "body",
-                            "required": True,
-                            "schema": {
+            "post": {
+                "tags": ["Turf Owner"],
+                "summary": "Add multiple turfs in one request",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "array",
+                            "items": {
                                 "type": "object",
                                 "properties": {
                                     "name": {"type": "string"},
@@ -341,359 +622,327 @@ def swagger_json():
                                 }
                             }
                         }
-                    ],
-                    "responses": {
-                        "200": {"description": "Turf updated successfully"},
-                        "400": {"description": "Invalid input"},
-                        "403": {"description": "Unauthorized"},
-                        "404": {"description": "Turf not found"}
-                    }
-                },
-                "delete": {
-                    "tags": ["Turf Owner"],
-                    "summary": "Delete a turf",
-                    "security": [{"Bearer": []}],
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "type": "string"
-                        }
-                    ],
-                    "responses": {
-                        "200": {"description": "Turf deleted successfully"},
-                        "403": {"description": "Unauthorized"},
-                        "404": {"description": "Turf not found"}
-                    }
-                }
-            },
-            "/owner/turfs": {
-                "get": {
-                    "tags": ["Turf Owner"],
-                    "summary": "Get all turfs owned by the owner",
-                    "security": [{"Bearer": []}],
-                    "responses": {
-                        "200": {"description": "List of turfs"},
-                        "404": {"description": "No turfs found"}
                     }
+                ],
+                "responses": {
+                    "201": {"description": "Turfs created successfully"},
+                    "400": {"description": "Invalid input"}
                 }
-            },
-            "/owner/turf/<id>/bookings": {
-                "get": {
-                    "tags": ["Turf Owner"],
-                    "summary": "Get all bookings for a turf",
-                    "security": [{"Bearer": []}],
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "type": "string"
-                        }
-                    ],
-                    "responses": {
-                        "200": {"description": "List of bookings"},
-                        "403": {"description": "Unauthorized"},
-                        "404": {"description": "No bookings found"}
+            }
+        },
+        "/owner/turf/<id>/bookings": {
+            "get": {
+                "tags": ["Turf Owner"],
+                "summary": "Get all bookings for a turf",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "type": "string"
                     }
+                ],
+                "responses": {
+                    "200": {"description": "List of bookings"},
+                    "403": {"description": "Unauthorized"},
+                    "404": {"description": "No bookings found"}
                 }
             }
         }
     }
-    return jsonify(swagger)
+}
+
+SWAGGER_JSON_BYTES = orjson.dumps(SWAGGER_DOC)
+SWAGGER_ETAG = hashlib.sha256(SWAGGER_JSON_BYTES).hexdigest()
+
+@app.route('/static/swagger.json')
+def swagger_json():
+    if request.if_none_match.contains(SWAGGER_ETAG):
+        return Response(status=304, headers={'ETag': f'"{SWAGGER_ETAG}"'})
+    return Response(
+        SWAGGER_JSON_BYTES,
+        mimetype='application/json',
+        headers={'ETag': f'"{SWAGGER_ETAG}"', 'Cache-Control': 'public, max-age=3600'}
+    )
+
+# Account route factories shared by users and turf owners
+def make_register_view(collection, profile_fields, created_message):
+    required_keys = itemgetter('username', 'email', 'password', *profile_fields)
+
+    def register():
+        try:
+            values = required_keys(get_json_body())
+        except (KeyError, TypeError):
+            return json_response({'message': 'Missing fields'}), 400
+        if not all(values):
+            return json_response({'message': 'Missing fields'}), 400
+
+        username, email, password = values[:3]
+        profile = dict(zip(profile_fields, values[3:]))
+
+        hashed_password = run_blocking(generate_password_hash, password, PASSWORD_HASH_METHOD)
+        try:
+            account_id = collection.insert_one({
+                'username': username,
+                'email': email,
+                'password': hashed_password,
+                **profile,
+                'created_at': datetime.datetime.utcnow()
+            }).inserted_id
+        except DuplicateKeyError as e:
+            return duplicate_key_response(e)
+
+        return json_response({'message': created_message, 'id': str(account_id)}), 201
+    return register
+
+def make_login_view(collection, user_type, profile_fields):
+    # Only the fields the login response and password check read
+    projection = {field: 1 for field in ('username', 'email', 'password', *profile_fields, 'created_at')}
+
+    def login():
+        try:
+            email, password = _login_keys(get_json_body())
+        except (KeyError, TypeError):
+            return json_response({'message': 'Missing fields'}), 400
+        if not email or not password:
+            return json_response({'message': 'Missing fields'}), 400
+
+        account = collection.find_one({'email': email}, projection)
+        if not account or not run_blocking(check_password_hash, account['password'], password):
+            return json_response({'message': 'Invalid credentials'}), 401
+
+        token = jwt.encode({
+            'user_type': user_type,
+            'user_id': str(account['_id']),
+            'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=24)
+        }, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+        account_data = {
+            'id': str(account['_id']),
+            'username': account['username'],
+            'email': account['email'],
+            **{field: account[field] for field in profile_fields},
+            # orjson encodes the datetime directly as ISO 8601
+            'created_at': account['created_at']
+        }
+        return json_response({'message': 'Login successful', user_type: account_data, 'token': token}), 200
+    return login
 
 # User Routes
-@app.route('/user/register', methods=['POST'])
-def user_register():
-    data = request.get_json()
-    username = data.get('username')
-    email = data.get('email')
-    password = data.get('password')
-    full_name = data.get('full_name')
-    phone = data.get('phone')
-
-    if not all([username, email, password, full_name, phone]):
-        return jsonify({'message': 'Missing fields'}), 400
-
-    if mongo.db.users.find_one({'email': email}):
-        return jsonify({'message': 'Email already registered'}), 400
-    if mongo.db.users.find_one({'username': username}):
-        return jsonify({'message': 'Username already taken'}), 400
-
-    hashed_password = generate_password_hash(password)
-    user_id = mongo.db.users.insert_one({
-        'username': username,
-        'email': email,
-        'password': hashed_password,
-        'full_name': full_name,
-        'phone': phone,
-        'created_at': datetime.datetime.utcnow()
-    }).inserted_id
-
-    return jsonify({'message': 'User created successfully', 'id': str(user_id)}), 201
-
-@app.route('/user/login', methods=['POST'])
-def user_login():
-    data = request.get_json()
-    email = data.get('email')
-    password = data.get('password')
-
-    if not email or not password:
-        return jsonify({'message': 'Missing fields'}), 400
-
-    user = mongo.db.users.find_one({'email': email})
-    if not user or not check_password_hash(user['password'], password):
-        return jsonify({'message': 'Invalid credentials'}), 401
-
-    token = jwt.encode({
-        'user_type': 'user',
-        'user_id': str(user['_id']),
-        'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=24)
-    }, app.config['SECRET_KEY'])
-
-    user_data = {
-        'id': str(user['_id']),
-        'username': user['username'],
-        'email': user['email'],
-        'full_name': user['full_name'],
-        'phone': user['phone'],
-        'created_at': user['created_at'].isoformat()
-    }
-    return jsonify({'message': 'Login successful', 'user': user_data, 'token': token}), 200
+app.add_url_rule('/user/register', 'user_register', make_register_view(
+    mongo.db.users, USER_PROFILE_FIELDS, 'User created successfully'
+), methods=['POST'])
+app.add_url_rule('/user/login', 'user_login', make_login_view(
+    mongo.db.users, 'user', USER_PROFILE_FIELDS
+), methods=['POST'])
 
 @app.route('/user/turfs', methods=['GET'])
 def get_turfs():
-    turfs = mongo.db.turfs.find({'availability': True})
-    turfs_list = turfs_schema.dump(turfs)
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', DEFAULT_PER_PAGE, type=int)
+    if page < 1 or per_page < 1:
+        return json_response({'message': 'Invalid pagination parameters'}), 400
+    per_page = min(per_page, MAX_PER_PAGE)
+
+    version = turfs_cache_version()
+    cache_key = f'turfs_available:{version}:{page}:{per_page}' if version is not None else None
+    turfs_list = get_cached_turfs(cache_key) if cache_key else None
+    if turfs_list is None:
+        # batch_size == limit returns the whole page in the initial reply
+        turfs = (mongo.db.turfs.find({'availability': True}, TURF_PROJECTION)
+                 .sort('_id', 1)
+                 .skip((page - 1) * per_page)
+                 .limit(per_page)
+                 .batch_size(per_page))
+        turfs_list = [dump_turf(turf) for turf in turfs]
+        if cache_key:
+            set_cached_turfs(cache_key, turfs_list)
     if not turfs_list:
-        return jsonify({'message': 'No turfs available'}), 404
-    return jsonify(turfs_list), 200
+        return json_response({'message': 'No turfs available'}), 404
+    return json_response(turfs_list), 200
 
 @app.route('/user/book', methods=['POST'])
 @token_required
 def book_turf(current_user):
     if current_user[0] != 'user':
-        return jsonify({'message': 'Unauthorized'}), 403
+        return json_response({'message': 'Unauthorized'}), 403
 
-    data = request.get_json()
+    data = get_json_body()
     user_id = current_user[1]
-    turf_id = data.get('turf_id')
-    start_time = data.get('start_time')
-    end_time = data.get('end_time')
+    try:
+        turf_id, start_time, end_time = _booking_required_keys(data)
+    except (KeyError, TypeError):
+        return json_response({'message': 'Missing fields'}), 400
+    if not (turf_id and start_time and end_time):
+        return json_response({'message': 'Missing fields'}), 400
     notes = data.get('notes', '')
 
-    if not all([turf_id, start_time, end_time]):
-        return jsonify({'message': 'Missing fields'}), 400
+    turf_oid = parse_object_id(turf_id)
+    if turf_oid is None:
+        return json_response({'message': 'Invalid turf ID'}), 400
+    # Canonical lowercase form, so every spelling of the id matches the same bookings
+    turf_id = str(turf_oid)
 
     try:
-        start_time = parser.parse(start_time)
-        end_time = parser.parse(end_time)
-    except:
-        return jsonify({'message': 'Invalid date format'}), 400
+        # ISO 8601 as declared in the API spec; 'Z' is normalised for Python < 3.11
+        start_time = datetime.datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+        end_time = datetime.datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return json_response({'message': 'Invalid date format'}), 400
 
     if start_time >= end_time:
-        return jsonify({'message': 'End time must be after start time'}), 400
-
-    turf = mongo.db.turfs.find_one({'_id': ObjectId(turf_id), 'availability': True})
-    if not turf:
-        return jsonify({'message': 'Turf not found or unavailable'}), 404
-
-    # Check for overlapping bookings
-    existing_booking = mongo.db.bookings.find_one({
-        'turf_id': turf_id,
-        'status': 'confirmed',
-        '$or': [
-            {'start_time': {'$lte': end_time, '$gte': start_time}},
-            {'end_time': {'$gte': start_time, '$lte': end_time}},
-            {'start_time': {'$lte': start_time}, 'end_time': {'$gte': end_time}}
-        ]
-    })
-    if existing_booking:
-        return jsonify({'message': 'Time slot unavailable'}), 409
-
-    # Calculate total cost
-    duration_hours = (end_time - start_time).total_seconds() / 3600
-    total_cost = turf['price_per_hour'] * duration_hours
-
-    booking_id = mongo.db.bookings.insert_one({
-        'user_id': user_id,
-        'turf_id': turf_id,
-        'start_time': start_time,
-        'end_time': end_time,
-        'status': 'confirmed',
-        'total_cost': total_cost,
-        'created_at': datetime.datetime.utcnow(),
-        'notes': notes
-    }).inserted_id
-
-    return jsonify({'message': 'Booking created successfully', 'id': str(booking_id)}), 201
+        return json_response({'message': 'End time must be after start time'}), 400
+
+    def create_booking(session):
+        # Writing to the turf makes concurrent bookings of it conflict, so the
+        # overlap check and insert below cannot interleave with another booking
+        turf = mongo.db.turfs.find_one_and_update(
+            {'_id': turf_oid, 'availability': True},
+            {'$inc': {'booking_version': 1}},
+            projection={'price_per_hour': 1},
+            session=session
+        )
+        if not turf:
+            return json_response({'message': 'Turf not found or unavailable'}), 404
+
+        # Check for overlapping bookings: [start, end) intervals overlap when each starts before the other ends
+        existing_booking = mongo.db.bookings.find_one({
+            'turf_id': turf_id,
+            'status': 'confirmed',
+            'start_time': {'$lt': end_time},
+            'end_time': {'$gt': start_time}
+        }, {'_id': 1}, session=session)
+        if existing_booking:
+            return json_response({'message': 'Time slot unavailable'}), 409
+
+        # Calculate total cost
+        duration_hours = (end_time - start_time).total_seconds() / 3600
+        total_cost = turf['price_per_hour'] * duration_hours
+
+        booking_id = mongo.db.bookings.insert_one({
+            'user_id': user_id,
+            'turf_id': turf_id,
+            'start_time': start_time,
+            'end_time': end_time,
+            'status': 'confirmed',
+            'total_cost': total_cost,
+            'created_at': datetime.datetime.utcnow(),
+            'notes': notes
+        }, session=session).inserted_id
+
+        return json_response({'message': 'Booking created successfully', 'id': str(booking_id)}), 201
+
+    # with_transaction retries the callback when a concurrent booking causes a write conflict
+    try:
+        with mongo.cx.start_session() as session:
+            return session.with_transaction(create_booking)
+    except OperationFailure as e:
+        # IllegalOperation: transactions are unavailable on a standalone mongod
+        if e.code != 20:
+            raise
+        app.logger.error('Booking transaction rejected, MongoDB is not a replica set: %s', e)
+        return json_response({'message': 'Bookings require MongoDB to run as a replica set'}), 503
 
 @app.route('/user/bookings', methods=['GET'])
 @token_required
 def get_user_bookings(current_user):
     if current_user[0] != 'user':
-        return jsonify({'message': 'Unauthorized'}), 403
+        return json_response({'message': 'Unauthorized'}), 403
 
-    bookings = mongo.db.bookings.find({'user_id': current_user[1]})
-    bookings_list = bookings_schema.dump(bookings)
-    if not bookings_list:
-        return jsonify({'message': 'No bookings found'}), 404
-    return jsonify(bookings_list), 200
+    bookings = mongo.db.bookings.find({'user_id': current_user[1]}, BOOKING_PROJECTION).batch_size(LISTING_BATCH_SIZE)
+    first = next(bookings, None)
+    if first is None:
+        return json_response({'message': 'No bookings found'}), 404
+    return stream_json_list(first, bookings, dump_booking), 200
 
 @app.route('/user/booking/<id>', methods=['DELETE'])
 @token_required
 def cancel_booking(current_user, id):
     if current_user[0] != 'user':
-        return jsonify({'message': 'Unauthorized'}), 403
+        return json_response({'message': 'Unauthorized'}), 403
 
-    booking = mongo.db.bookings.find_one({'_id': ObjectId(id), 'user_id': current_user[1]})
+    booking_oid = parse_object_id(id)
+    if booking_oid is None:
+        return json_response({'message': 'Invalid booking ID'}), 400
+
+    booking = mongo.db.bookings.find_one({'_id': booking_oid, 'user_id': current_user[1]})
     if not booking:
-        return jsonify({'message': 'Booking not found or unauthorized'}), 404
+        return json_response({'message': 'Booking not found or unauthorized'}), 404
 
     if booking['status'] == 'cancelled':
-        return jsonify({'message': 'Booking already cancelled'}), 400
+        return json_response({'message': 'Booking already cancelled'}), 400
 
     mongo.db.bookings.update_one(
-        {'_id': ObjectId(id)},
+        {'_id': booking_oid},
         {'$set': {'status': 'cancelled'}}
     )
-    return jsonify({'message': 'Booking cancelled successfully'}), 200
+    return json_response({'message': 'Booking cancelled successfully'}), 200
 
 # Turf Owner Routes
-@app.route('/owner/register', methods=['POST'])
-def owner_register():
-    data = request.get_json()
-    username = data.get('username')
-    email = data.get('email')
-    password = data.get('password')
-    name = data.get('name')
-    phone = data.get('phone')
-    business_name = data.get('business_name')
-    address = data.get('address')
-
-    if not all([username, email, password, name, phone, business_name, address]):
-        return jsonify({'message': 'Missing fields'}), 400
-
-    if mongo.db.turf_owners.find_one({'email': email}):
-        return jsonify({'message': 'Email already registered'}), 400
-    if mongo.db.turf_owners.find_one({'username': username}):
-        return jsonify({'message': 'Username already taken'}), 400
-
-    hashed_password = generate_password_hash(password)
-    owner_id = mongo.db.turf_owners.insert_one({
-        'username': username,
-        'email': email,
-        'password': hashed_password,
-        'name': name,
-        'phone': phone,
-        'business_name': business_name,
-        'address': address,
-        'created_at': datetime.datetime.utcnow()
-    }).inserted_id
-
-    return jsonify({'message': 'Turf owner created successfully', 'id': str(owner_id)}), 201
-
-@app.route('/owner/login', methods=['POST'])
-def owner_login():
-    data = request.get_json()
-    email = data.get('email')
-    password = data.get('password')
-
-    if not email or not password:
-        return jsonify({'message': 'Missing fields'}), 400
-
-    owner = mongo.db.turf_owners.find_one({'email': email})
-    if not owner or not check_password_hash(owner['password'], password):
-        return jsonify({'message': 'Invalid credentials'}), 401
-
-    token = jwt.encode({
-        'user_type': 'owner',
-        'user_id': str(owner['_id']),
-        'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=24)
-    }, app.config['SECRET_KEY'])
-
-    owner_data = {
-        'id': str(owner['_id']),
-        'username': owner['username'],
-        'email': owner['email'],
-        'name': owner['name'],
-        'phone': owner['phone'],
-        'business_name': owner['business_name'],
-        'address': owner['address'],
-        'created_at': owner['created_at'].isoformat()
-    }
-    return jsonify({'message': 'Login successful', 'owner': owner_data, 'token': token}), 200
+app.add_url_rule('/owner/register', 'owner_register', make_register_view(
+    mongo.db.turf_owners, OWNER_PROFILE_FIELDS, 'Turf owner created successfully'
+), methods=['POST'])
+app.add_url_rule('/owner/login', 'owner_login', make_login_view(
+    mongo.db.turf_owners, 'owner', OWNER_PROFILE_FIELDS
+), methods=['POST'])
 
 @app.route('/owner/turf', methods=['POST'])
 @token_required
 def add_turf(current_user):
     if current_user[0] != 'owner':
-        return jsonify({'message': 'Unauthorized'}), 403
-
-    data = request.get_json()
-    name = data.get('name')
-    location = data.get('location')
-    size = data.get('size')
-    amenities = data.get('amenities', [])
-    price_per_hour = data.get('price_per_hour')
-    availability = data.get('availability', True)
-    surface_type = data.get('surface_type')
-    capacity = data.get('capacity')
-    description = data.get('description', '')
+        return json_response({'message': 'Unauthorized'}), 403
 
-    if not all([name, location, size, price_per_hour, surface_type, capacity]):
-        return jsonify({'message': 'Missing fields'}), 400
+    turf = build_turf(get_json_body(), current_user[1])
+    if turf is None:
+        return json_response({'message': 'Missing fields'}), 400
 
-    turf_id = mongo.db.turfs.insert_one({
-        'owner_id': current_user[1],
-        'name': name,
-        'location': location,
-        'size': size,
-        'amenities': amenities,
-        'price_per_hour': price_per_hour,
-        'availability': availability,
-        'surface_type': surface_type,
-        'capacity': capacity,
-        'description': description
-    }).inserted_id
+    turf_id = mongo.db.turfs.insert_one(turf).inserted_id
+    invalidate_turfs_cache()
 
-    return jsonify({'message': 'Turf added successfully', 'id': str(turf_id)}), 201
+    return json_response({'message': 'Turf added successfully', 'id': str(turf_id)}), 201
 
 @app.route('/owner/turf/<id>', methods=['PUT'])
 @token_required
 def update_turf(current_user, id):
     if current_user[0] != 'owner':
-        return jsonify({'message': 'Unauthorized'}), 403
-
-    turf = mongo.db.turfs.find_one({'_id': ObjectId(id), 'owner_id': current_user[1]})
-    if not turf:
-        return jsonify({'message': 'Turf not found or unauthorized'}), 404
+        return json_response({'message': 'Unauthorized'}), 403
 
-    data = request.get_json()
-    update_data = {}
-    for field in ['name', 'location', 'size', 'amenities', 'price_per_hour', 'availability', 'surface_type', 'capacity', 'description']:
-        if field in data:
-            update_data[field] = data[field]
+    turf_oid = parse_object_id(id)
+    if turf_oid is None:
+        return json_response({'message': 'Invalid turf ID'}), 400
 
+    data = get_json_body()
+    update_data = {field: data[field] for field in TURF_UPDATE_FIELDS if field in data}
     if not update_data:
-        return jsonify({'message': 'No fields to update'}), 400
+        return json_response({'message': 'No fields to update'}), 400
 
-    mongo.db.turfs.update_one(
-        {'_id': ObjectId(id)},
-        {'$set': update_data}
+    # Ownership check and update in a single round-trip
+    turf = mongo.db.turfs.find_one_and_update(
+        {'_id': turf_oid, 'owner_id': current_user[1]},
+        {'$set': update_data},
+        projection={'_id': 1}
     )
-    return jsonify({'message': 'Turf updated successfully'}), 200
+    if not turf:
+        return json_response({'message': 'Turf not found or unauthorized'}), 404
+    invalidate_turfs_cache()
+    return json_response({'message': 'Turf updated successfully'}), 200
 
 @app.route('/owner/turf/<id>', methods=['DELETE'])
 @token_required
 def delete_turf(current_user, id):
     if current_user[0] != 'owner':
-        return jsonify({'message': 'Unauthorized'}), 403
+        return json_response({'message': 'Unauthorized'}), 403
+
+    turf_oid = parse_object_id(id)
+    if turf_oid is None:
+        return json_response({'message': 'Invalid turf ID'}), 400
+    # Bookings store the canonical string form of the turf id
+    id = str(turf_oid)
 
-    turf = mongo.db.turfs.find_one({'_id': ObjectId(id), 'owner_id': current_user[1]})
+    turf = mongo.db.turfs.find_one({'_id': turf_oid, 'owner_id': current_user[1]})
     if not turf:
-        return jsonify({'message': 'Turf not found or unauthorized'}), 404
+        return json_response({'message': 'Turf not found or unauthorized'}), 404
 
     # Check for active bookings
     active_bookings = mongo.db.bookings.find_one({
@@ -701,38 +950,76 @@ def delete_turf(current_user, id):
         'status': 'confirmed'
     })
     if active_bookings:
-        return jsonify({'message': 'Cannot delete turf with active bookings'}), 400
+        return json_response({'message': 'Cannot delete turf with active bookings'}), 400
 
-    mongo.db.turfs.delete_one({'_id': ObjectId(id)})
-    return jsonify({'message': 'Turf deleted successfully'}), 200
+    mongo.db.turfs.delete_one({'_id': turf_oid})
+    invalidate_turfs_cache()
+    return json_response({'message': 'Turf deleted successfully'}), 200
 
 @app.route('/owner/turfs', methods=['GET'])
 @token_required
 def get_owner_turfs(current_user):
     if current_user[0] != 'owner':
-        return jsonify({'message': 'Unauthorized'}), 403
+        return json_response({'message': 'Unauthorized'}), 403
 
-    turfs = mongo.db.turfs.find({'owner_id': current_user[1]})
-    turfs_list = turfs_schema.dump(turfs)
-    if not turfs_list:
-        return jsonify({'message': 'No turfs found'}), 404
-    return jsonify(turfs_list), 200
+    turfs = mongo.db.turfs.find({'owner_id': current_user[1]}, TURF_PROJECTION).batch_size(LISTING_BATCH_SIZE)
+    first = next(turfs, None)
+    if first is None:
+        return json_response({'message': 'No turfs found'}), 404
+    return stream_json_list(first, turfs, dump_turf), 200
+
+@app.route('/owner/turfs', methods=['POST'])
+@token_required
+def add_turfs(current_user):
+    if current_user[0] != 'owner':
+        return json_response({'message': 'Unauthorized'}), 403
+
+    data = get_json_body()
+    if not isinstance(data, list) or not data:
+        return json_response({'message': 'Expected a non-empty list of turfs'}), 400
+    if len(data) > MAX_BULK_TURFS:
+        return json_response({'message': f'At most {MAX_BULK_TURFS} turfs per request'}), 400
+
+    turfs = []
+    for index, item in enumerate(data):
+        turf = build_turf(item, current_user[1]) if isinstance(item, dict) else None
+        if turf is None:
+            return json_response({'message': f'Missing fields in turf at index {index}'}), 400
+        turfs.append(turf)
+
+    # One unordered bulk write instead of a round-trip per turf
+    result = mongo.db.turfs.insert_many(turfs, ordered=False)
+    invalidate_turfs_cache()
+    return json_response({
+        'message': 'Turfs added successfully',
+        'ids': [str(turf_id) for turf_id in result.inserted_ids]
+    }), 201
 
 @app.route('/owner/turf/<id>/bookings', methods=['GET'])
 @token_required
 def get_turf_bookings(current_user, id):
     if current_user[0] != 'owner':
-        return jsonify({'message': 'Unauthorized'}), 403
+        return json_response({'message': 'Unauthorized'}), 403
+
+    turf_oid = parse_object_id(id)
+    if turf_oid is None:
+        return json_response({'message': 'Invalid turf ID'}), 400
+    # Bookings store the canonical string form of the turf id
+    id = str(turf_oid)
 
-    turf = mongo.db.turfs.find_one({'_id': ObjectId(id), 'owner_id': current_user[1]})
+    turf = mongo.db.turfs.find_one({'_id': turf_oid, 'owner_id': current_user[1]})
     if not turf:
-        return jsonify({'message': 'Turf not found or unauthorized'}), 404
+        return json_response({'message': 'Turf not found or unauthorized'}), 404
 
-    bookings = mongo.db.bookings.find({'turf_id': id})
-    bookings_list = bookings_schema.dump(bookings)
-    if not bookings_list:
-        return jsonify({'message': 'No bookings found'}), 404
-    return jsonify(bookings_list), 200
+    bookings = mongo.db.bookings.find({'turf_id': id}, BOOKING_PROJECTION).batch_size(LISTING_BATCH_SIZE)
+    first = next(bookings, None)
+    if first is None:
+        return json_response({'message': 'No bookings found'}), 404
+    return stream_json_list(first, bookings, dump_booking), 200
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5001, debug=True)
\ No newline at end of file
+    # Development server only; production runs under gunicorn, which builds
+    # indexes once in its master process (see gunicorn_conf.py)
+    from indexes import ensure_indexes
+    ensure_indexes(mongo.db, app.logger)
+    app.run(host='0.0.0.0', port=5001, debug=os.getenv('FLASK_DEBUG') == '1')
\ No newline at end of file
@@ -0,0 +1,21 @@
+import multiprocessing
+import os
+
+from indexes import build_indexes
+
+# Gunicorn configuration, used via: gunicorn app:app -c gunicorn_conf.py
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+
+# Concurrent clients per gevent worker
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# Only used when worker_class is gthread
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Build MongoDB indexes once in the master before workers fork, so workers
+# boot without touching the database and gunicorn's worker timeout never
+# races an index build. A failure on the required unique indexes aborts
+# startup here, once, instead of crash-looping every worker.
+def on_starting(server):
+    build_indexes(server.log)
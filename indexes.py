@@ -0,0 +1,51 @@
+import logging
+import os
+
+import pymongo
+from dotenv import load_dotenv
+from pymongo.errors import PyMongoError
+
+# Index builds on large collections can take minutes; pymongo.timeout bounds
+# them instead of the request socket timeout the app's client uses
+INDEX_BUILD_TIMEOUT_SECONDS = float(os.getenv('MONGO_INDEX_BUILD_TIMEOUT_SECONDS', 600))
+
+# (collection, keys, options, required). Registration relies solely on the
+# unique indexes to reject duplicate accounts, so failing to build them
+# must stop startup; the rest only affect query speed.
+INDEXES = [
+    ('users', 'email', {'unique': True}, True),
+    ('users', 'username', {'unique': True}, True),
+    ('turf_owners', 'email', {'unique': True}, True),
+    ('turf_owners', 'username', {'unique': True}, True),
+    # Partial index only holds available turfs, the sole filter used on this field
+    ('turfs', 'availability', {'partialFilterExpression': {'availability': True}}, False),
+    ('turfs', 'owner_id', {}, False),
+    ('bookings', [('turf_id', 1), ('status', 1), ('start_time', 1), ('end_time', 1)], {}, False),
+    ('bookings', 'user_id', {}, False),
+]
+
+logger = logging.getLogger(__name__)
+
+def ensure_indexes(db, log=logger):
+    with pymongo.timeout(INDEX_BUILD_TIMEOUT_SECONDS):
+        for name, keys, options, required in INDEXES:
+            if required:
+                db[name].create_index(keys, **options)
+                continue
+            try:
+                db[name].create_index(keys, **options)
+            except PyMongoError as e:
+                log.warning('Could not create index %s on %s: %s', keys, name, e)
+
+def build_indexes(log=logger):
+    # Short-lived client, closed before returning so nothing is shared across a fork
+    load_dotenv()
+    client = pymongo.MongoClient(os.getenv('MONGO_URI'))
+    try:
+        ensure_indexes(client.get_default_database(), log)
+    finally:
+        client.close()
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    build_indexes()